@@ -1,190 +1,331 @@
+import math
+
+import numpy as np
 import streamlit as st
 from collections import deque
-from typing import List, Dict
+from typing import List, Dict, Optional
+
+import _kernel
+
+# Codificação interna do histórico: um int8 por resultado
+_CODE = {'PLAYER': 0, 'BANKER': 1, 'TIE': 2}
+_NAMES = ('PLAYER', 'BANKER', 'TIE')
+# Tokens de Fibonacci por código (PLAYER=2, BANKER=3, TIE=5)
+_FIB_LUT = np.array([2, 3, 5], dtype=np.int8)
+# Tupla interna dos analisadores: (código, confiança, razão); -1 = sem previsão
+_NO_PRED = (-1, 0.0, '')
+# Classes CSS das bolinhas do histórico, por código
+_HIST_CLS = ('player-history', 'banker-history', 'tie-history')
+_HIST_HTML_HEAD = "<div class='history-container'>"
+# Glifos P/B/T por código; a tabela permite decodificar o buffer inteiro
+# com um único bytes.translate em vez de indexar entrada por entrada
+_GLYPHS = 'PBT'
+_GLYPH_TRANS = bytes.maketrans(b'\x00\x01\x02', b'PBT')
+# Span completo de cada resultado no histórico, pronto por código
+_HIST_SPANS = tuple(
+    f"<div class='history-item {_HIST_CLS[c]}'>{_GLYPHS[c]}</div>"
+    for c in range(3)
+)
+
+try:
+    import xxhash
+
+    def _tail_fingerprint(data: bytes) -> int:
+        return xxhash.xxh64(data).intdigest()
+except ImportError:  # xxhash é opcional
+    def _tail_fingerprint(data: bytes) -> int:
+        return hash(data)
 
 class BacBoPredictor:
+    __slots__ = (
+        '_buf', '_n', 'prediction_stats',
+        '_lp_pred', '_lp_actual', '_lp_conf', '_lp_pos', '_lp_size',
+        'last_prediction', 'quantum_threshold', 'fibonacci_sequence',
+        'pressure_points', '_fib_trigrams', '_fib_trigram_mat',
+        '_fib_pred_code', '_fib_conf', '_fib_reason',
+        '_win_counts', '_pp_lcm', '_pp_by_mod', '_next_pp_total',
+        '_pred_cache', '_pred_cache_order', '_history_html', '_dirty',
+        '_recent_cached', '_recent_wins', '_run_len', '_run_val',
+        '_stats_cache', '_stats_dirty',
+    )
+
     def __init__(self):
-        self.game_history = []
+        self._buf = np.empty(1024, dtype=np.int8)
+        self._n = 0
         self.prediction_stats = {'wins': 0, 'total': 0, 'win_rate': 0.0}
-        self.last_predictions = deque(maxlen=20)
+        # Últimas 20 previsões em arrays paralelos (SoA) em anel
+        self._lp_pred = np.full(20, -1, dtype=np.int8)
+        self._lp_actual = np.full(20, -1, dtype=np.int8)
+        self._lp_conf = np.zeros(20, dtype=np.float32)
+        self._lp_pos = 0
+        self._lp_size = 0
+        self._recent_wins = 0
+        self._recent_cached: Optional[List[Dict]] = None
+        self._stats_cache: Optional[Dict] = None
+        self._stats_dirty = True
+        self.last_prediction: Optional[Dict] = None
         self.quantum_threshold = 7
         self.fibonacci_sequence = [2, 3, 5, 8, 13, 21, 34]
         self.pressure_points = [5, 7, 10, 15, 20, 25, 30]
+        # Trigramas de Fibonacci fixos, pré-calculados uma única vez:
+        # para cada trigrama, o código previsto, a confiança e a razão
+        fib = self.fibonacci_sequence
+        self._fib_trigrams = [tuple(fib[i:i + 3]) for i in range(len(fib) - 2)]
+        self._fib_trigram_mat = np.array(self._fib_trigrams, dtype=np.int8)
+        fib_next = [fib[i + 3] if i + 3 < len(fib) else 3
+                    for i in range(len(fib) - 2)]
+        self._fib_pred_code = [0 if v == 2 else 1 if v == 3 else 2
+                               for v in fib_next]
+        self._fib_conf = [83.0 + 2 * i for i in range(len(self._fib_trigrams))]
+        self._fib_reason = [f'Fibonacci Dinâmico ({list(t)})'
+                            for t in self._fib_trigrams]
+        # Contadores incrementais (P/B/T) por janela deslizante; listas
+        # simples: para 3 posições o overhead de um ndarray não compensa
+        self._win_counts = {
+            k: [0, 0, 0]
+            for k in {5, 10, 15, 100} | set(self.pressure_points)
+        }
+        # Tabela total % lcm -> primeiro ponto de pressão divisor (0 = nenhum)
+        self._pp_lcm = math.lcm(*self.pressure_points)
+        self._pp_by_mod = [0] * self._pp_lcm
+        for r in range(self._pp_lcm):
+            for point in self.pressure_points:
+                if r % point == 0:
+                    self._pp_by_mod[r] = point
+                    break
+        # Próximo total que dispara algum ponto de pressão
+        self._next_pp_total = min(self.pressure_points)
+        # Cache LRU de previsões: (n, fingerprint da cauda) -> resultado
+        self._pred_cache: Dict[tuple, Dict] = {}
+        self._pred_cache_order = deque(maxlen=128)
+        # HTML do histórico montado incrementalmente a cada resultado
+        self._history_html = _HIST_HTML_HEAD
+        # True enquanto houver resultado novo ainda não refletido na previsão
+        self._dirty = True
+        # Comprimento/valor da sequência corrente (para o entrelaçamento)
+        self._run_len = 0
+        self._run_val = -1
+
+    @property
+    def game_history(self) -> List[str]:
+        return [_NAMES[c] for c in self._buf[:self._n]]
 
     def add_result(self, result: str):
         result = result.upper()
-        if result not in ['PLAYER', 'BANKER', 'TIE']:
+        code = _CODE.get(result)
+        if code is None:
             raise ValueError("Resultado inválido")
-        
-        self.game_history.append(result)
-        
-        if len(self.game_history) >= 5:
-            self.last_prediction = self.predict_next()
+
+        self._ingest(code, result)
+        if self._n >= 5:
             st.session_state.last_prediction = self.last_prediction
-            
-            if len(self.game_history) > 5:
+
+    def _ingest(self, code: int, result: str):
+        if self._n == len(self._buf):
+            self._buf = np.resize(self._buf, len(self._buf) * 2)
+        self._buf[self._n] = code
+        self._n += 1
+        self._dirty = True
+        self._stats_dirty = True
+        if code == self._run_val:
+            self._run_len += 1
+        else:
+            self._run_val = code
+            self._run_len = 1
+        self._history_html += _HIST_SPANS[code]
+        if self._n > self._next_pp_total:
+            self._next_pp_total = min((self._n + p - 1) // p * p
+                                      for p in self.pressure_points)
+
+        for k, counts in self._win_counts.items():
+            counts[code] += 1
+            if self._n > k:
+                counts[self._buf[self._n - k - 1]] -= 1
+
+        if self._n >= 5:
+            self.last_prediction = self.predict_next()
+
+            if self._n > 5:
                 self._update_stats(result)
                 self._update_win_rate()
 
+    def replay(self, results: List[str]) -> List[Optional[Dict]]:
+        """Reproduz uma sequência de resultados de uma vez (backtesting).
+
+        Devolve a previsão gerada após cada resultado (None enquanto o
+        histórico ainda é insuficiente), sem espelhar cada passo no
+        session_state do Streamlit.
+        """
+        predictions: List[Optional[Dict]] = []
+        for result in results:
+            result = result.upper()
+            code = _CODE.get(result)
+            if code is None:
+                raise ValueError("Resultado inválido")
+            self._ingest(code, result)
+            predictions.append(self.last_prediction)
+        return predictions
+
     def _update_win_rate(self):
         if self.prediction_stats['total'] > 0:
-            self.prediction_stats['win_rate'] = round(
-                (self.prediction_stats['wins'] / self.prediction_stats['total']) * 100, 1
-            )
+            # Uma casa decimal via aritmética inteira, sem round()
+            self.prediction_stats['win_rate'] = (
+                self.prediction_stats['wins'] * 1000 // self.prediction_stats['total']
+            ) / 10.0
 
     def _update_stats(self, actual_result: str):
-        if hasattr(self, 'last_prediction') and self.last_prediction['prediction'] == actual_result:
+        if self.last_prediction is None:
+            self.prediction_stats['total'] += 1
+            return
+
+        pred_code = _CODE.get(self.last_prediction['prediction'], -1)
+        actual_code = _CODE[actual_result]
+        if pred_code == actual_code:
             self.prediction_stats['wins'] += 1
         self.prediction_stats['total'] += 1
-        
-        if hasattr(self, 'last_prediction'):
-            self.last_predictions.append({
-                'predicted': self.last_prediction['prediction'],
-                'actual': actual_result,
-                'confidence': self.last_prediction['confidence']
-            })
+
+        # Janela dos últimos 10: desconta o acerto que sai antes de entrar o novo
+        if self._lp_size >= 10:
+            j = (self._lp_pos - 10) % 20
+            if self._lp_pred[j] == self._lp_actual[j]:
+                self._recent_wins -= 1
+        if pred_code == actual_code:
+            self._recent_wins += 1
+
+        i = self._lp_pos % 20
+        self._lp_pred[i] = pred_code
+        self._lp_actual[i] = actual_code
+        self._lp_conf[i] = self.last_prediction['confidence']
+        self._lp_pos += 1
+        self._lp_size = min(self._lp_size + 1, 20)
+        self._recent_cached = None
 
     def predict_next(self) -> Dict:
-        if len(self.game_history) < 5:
+        # Sem resultado novo desde a última previsão: devolve a mesma
+        if not self._dirty and self.last_prediction is not None:
+            return self.last_prediction
+
+        n = self._n
+        if n < 5:
             return {'prediction': None, 'confidence': 0, 'reason': 'Histórico insuficiente'}
-        
-        try:
-            quantum = self._analyze_quantum_pattern()
-            fibonacci = self._analyze_dynamic_fibonacci()
-            pressure = self._analyze_pressure_points()
-            
-            predictions = [
-                {'method': quantum, 'weight': 0.45},
-                {'method': fibonacci, 'weight': 0.35},
-                {'method': pressure, 'weight': 0.20}
-            ]
-            
-            valid_preds = [p for p in predictions if p['method']['prediction'] is not None]
-            
-            if not valid_preds:
-                return self._smart_fallback()
-            
-            final_pred = self._aggregate_predictions(valid_preds)
-            return self._apply_bayesian_correction(final_pred)
-            
-        except Exception as e:
-            return {'prediction': None, 'confidence': 0, 'reason': f'Erro: {str(e)}'}
-
-    def _analyze_quantum_pattern(self) -> Dict:
-        last_15 = self.game_history[-15:]
-        player_count = last_15.count('PLAYER')
-        banker_count = last_15.count('BANKER')
-        
-        diff = abs(player_count - banker_count)
-        if diff >= self.quantum_threshold:
-            prediction = 'BANKER' if player_count > banker_count else 'PLAYER'
-            return {
-                'prediction': prediction,
-                'confidence': min(90, 75 + diff * 2),
-                'reason': f'Oscilação Quântica (Δ={diff})'
-            }
-        
-        last_5 = last_15[-5:]
-        if len(set(last_5)) == 1:
-            return {
-                'prediction': 'BANKER' if last_5[0] == 'PLAYER' else 'PLAYER',
-                'confidence': 89,
-                'reason': f'Entrelaçamento Quântico (5x {last_5[0]})'
-            }
-        
-        return {'prediction': None, 'confidence': 0, 'reason': ''}
 
-    def _analyze_dynamic_fibonacci(self) -> Dict:
-        last_10 = self.game_history[-10:]
-        numeric = [2 if x == 'PLAYER' else 3 if x == 'BANKER' else 5 for x in last_10]
-        
-        for i in range(len(self.fibonacci_sequence) - 2):
-            fib_seq = self.fibonacci_sequence[i:i+3]
-            if ','.join(map(str, fib_seq)) in ','.join(map(str, numeric)):
-                next_val = self.fibonacci_sequence[i+3] if i+3 < len(self.fibonacci_sequence) else 3
-                prediction = 'PLAYER' if next_val == 2 else 'BANKER' if next_val == 3 else 'TIE'
-                return {
-                    'prediction': prediction,
-                    'confidence': 83 + (i * 2),
-                    'reason': f'Fibonacci Dinâmico ({fib_seq})'
-                }
-        
-        return {'prediction': None, 'confidence': 0, 'reason': ''}
+        tail = self._buf[max(0, n - 100):n]
+        key = (n, _tail_fingerprint(tail.tobytes()))
+        cached = self._pred_cache.get(key)
+        if cached is not None:
+            self._dirty = False
+            return cached
 
-    def _analyze_pressure_points(self) -> Dict:
-        total = len(self.game_history)
-        
-        for point in self.pressure_points:
-            if total % point == 0 and total >= point:
-                last_n = self.game_history[-point:]
-                p_count = last_n.count('PLAYER')
-                b_count = last_n.count('BANKER')
-                
-                prediction = 'BANKER' if p_count > b_count else 'PLAYER'
-                return {
-                    'prediction': prediction,
-                    'confidence': 85 + min(10, abs(p_count - b_count)),
-                    'reason': f'Ponto de Pressão (múltiplo de {point})'
-                }
-        
-        return {'prediction': None, 'confidence': 0, 'reason': ''}
+        quantum = self._analyze_quantum_pattern()
+        fibonacci = self._analyze_dynamic_fibonacci(tail)
+        pressure = self._analyze_pressure_points(n)
 
-    def _aggregate_predictions(self, predictions: List[Dict]) -> Dict:
-        pred_counts = {}
-        total_weight = 0
-        
-        for pred in predictions:
-            method = pred['method']
-            weight = pred['weight']
-            
-            if method['prediction'] not in pred_counts:
-                pred_counts[method['prediction']] = {
-                    'confidence': 0,
-                    'reasons': [],
-                    'weight': 0
-                }
-            
-            pred_counts[method['prediction']]['confidence'] += method['confidence'] * weight
-            pred_counts[method['prediction']]['reasons'].append(method['reason'])
-            pred_counts[method['prediction']]['weight'] += weight
-            total_weight += weight
-        
-        final_pred = max(pred_counts.items(), key=lambda x: x[1]['weight'])
-        
+        predictions = [
+            (quantum, 0.45),
+            (fibonacci, 0.35),
+            (pressure, 0.20)
+        ]
+
+        valid_preds = [p for p in predictions if p[0][0] >= 0]
+
+        if not valid_preds:
+            result = self._smart_fallback()
+        else:
+            result = self._apply_bayesian_correction(self._aggregate_predictions(valid_preds))
+
+        if len(self._pred_cache_order) == self._pred_cache_order.maxlen:
+            self._pred_cache.pop(self._pred_cache_order[0], None)
+        self._pred_cache_order.append(key)
+        self._pred_cache[key] = result
+        self._dirty = False
+        return result
+
+    def _analyze_quantum_pattern(self) -> tuple:
+        # Janela de 15 ainda incompleta: deixa o fallback cobrir o início
+        if self._n < 15:
+            return _NO_PRED
+        player_count, banker_count, _ = self._win_counts[15]
+
+        code, conf, reason_id, arg = _kernel.quantum_core(
+            player_count, banker_count, self._run_len, self._run_val,
+            self.quantum_threshold
+        )
+        if code < 0:
+            return _NO_PRED
+
+        if reason_id == _kernel.R_QUANTUM_DIFF:
+            reason = f'Oscilação Quântica (Δ={arg})'
+        else:
+            reason = f'Entrelaçamento Quântico (5x {_NAMES[arg]})'
+        return code, conf, reason
+
+    def _analyze_dynamic_fibonacci(self, tail: np.ndarray) -> tuple:
+        if self._n < 10:
+            return _NO_PRED
+        numeric = _FIB_LUT[tail[-10:]]
+
+        i = _kernel.fib_scan(numeric, self._fib_trigram_mat)
+        if i >= 0:
+            return self._fib_pred_code[i], self._fib_conf[i], self._fib_reason[i]
+
+        return _NO_PRED
+
+    def _analyze_pressure_points(self, total: int) -> tuple:
+        # Caso comum (nenhum ponto dispara): uma única comparação
+        if total != self._next_pp_total:
+            return _NO_PRED
+
+        point = self._pp_by_mod[total % self._pp_lcm]
+        if point == 0 or total < point:
+            return _NO_PRED
+
+        p_count, b_count, _ = self._win_counts[point]
+
+        code = 1 if p_count > b_count else 0
+        conf = 85.0 + min(10, abs(p_count - b_count))
+        return code, conf, f'Ponto de Pressão (múltiplo de {point})'
+
+    def _aggregate_predictions(self, predictions: List[tuple]) -> Dict:
+        # Votação ponderada em 3 posições fixas (PLAYER/BANKER/TIE)
+        weights = [0.0, 0.0, 0.0]
+        conf_w = [0.0, 0.0, 0.0]
+        reasons: List[List[str]] = [[], [], []]
+
+        for (code, conf, reason), weight in predictions:
+            weights[code] += weight
+            conf_w[code] += conf * weight
+            reasons[code].append(reason)
+
+        winner = 0
+        if weights[1] > weights[winner]:
+            winner = 1
+        if weights[2] > weights[winner]:
+            winner = 2
         return {
-            'prediction': final_pred[0],
-            'confidence': final_pred[1]['confidence'] / final_pred[1]['weight'],
-            'reason': ' | '.join(final_pred[1]['reasons'])
+            'prediction': _NAMES[winner],
+            'confidence': conf_w[winner] / weights[winner],
+            'reason': ' | '.join(reasons[winner])
         }
 
     def _apply_bayesian_correction(self, prediction: Dict) -> Dict:
-        if len(self.game_history) < 50:
+        if self._n < 50:
             return prediction
+
+        p, b, t = self._win_counts[100]
+        total = p + b + t
         
-        last_100 = self.game_history[-100:]
-        p_ratio = last_100.count('PLAYER') / len(last_100)
-        b_ratio = last_100.count('BANKER') / len(last_100)
-        
-        if prediction['prediction'] == 'PLAYER' and p_ratio > 0.52:
-            return {
-                **prediction,
-                'confidence': max(75, prediction['confidence'] * 0.95),
-                'reason': prediction['reason'] + ' | Correção Bayesiana (PLAYER super-representado)'
-            }
-        
-        if prediction['prediction'] == 'BANKER' and b_ratio > 0.52:
-            return {
-                **prediction,
-                'confidence': max(75, prediction['confidence'] * 0.95),
-                'reason': prediction['reason'] + ' | Correção Bayesiana (BANKER super-representado)'
-            }
-        
+        # Razão indexada pelo código previsto; TIE nunca é corrigido.
+        # O dict vem recém-criado de _aggregate_predictions: corrigir no lugar
+        name = prediction['prediction']
+        code = _CODE[name]
+        if code < 2 and (p, b)[code] / total > 0.52:
+            prediction['confidence'] = max(75, prediction['confidence'] * 0.95)
+            prediction['reason'] += f' | Correção Bayesiana ({name} super-representado)'
+
         return prediction
 
     def _smart_fallback(self) -> Dict:
-        last_10 = self.game_history[-10:]
-        p_count = last_10.count('PLAYER')
-        b_count = last_10.count('BANKER')
+        p_count, b_count, _ = self._win_counts[10]
         
         if p_count < 3:
             return {'prediction': 'PLAYER', 'confidence': 65, 'reason': 'Correção: PLAYER sub-representado'}
@@ -193,25 +334,67 @@ class BacBoPredictor:
         
         return {'prediction': 'BANKER', 'confidence': 58, 'reason': 'Vantagem estatística padrão'}
 
+    def history_glyphs(self) -> str:
+        """Histórico completo como string 'PBT...' numa única tradução C."""
+        return self._buf[:self._n].tobytes().translate(_GLYPH_TRANS).decode('ascii')
+
+    def history_html(self) -> str:
+        return self._history_html + "</div>"
+
+    def _recent_predictions(self) -> List[Dict]:
+        if self._recent_cached is None:
+            idx = np.arange(self._lp_pos - self._lp_size, self._lp_pos) % 20
+            self._recent_cached = [
+                {
+                    'predicted': _NAMES[self._lp_pred[i]] if self._lp_pred[i] >= 0 else None,
+                    'actual': _NAMES[self._lp_actual[i]],
+                    'confidence': float(self._lp_conf[i])
+                }
+                for i in idx
+            ]
+        return self._recent_cached
+
     def get_stats(self) -> Dict:
+        if not self._stats_dirty and self._stats_cache is not None:
+            return self._stats_cache
+
         stats = {
             'win_rate': self.prediction_stats['win_rate'],
             'wins': self.prediction_stats['wins'],
             'total': self.prediction_stats['total'],
-            'recent_predictions': list(self.last_predictions) if self.last_predictions else []
+            'recent_predictions': self._recent_predictions()
         }
-        
-        if stats['total'] > 10 and self.last_predictions:
-            last_10 = list(self.last_predictions)[-10:]
-            correct = sum(1 for p in last_10 if p['predicted'] == p['actual'])
-            stats['recent_win_rate'] = round((correct / len(last_10)) * 100, 1) if last_10 else 0
-            
+
+        if stats['total'] > 10 and self._lp_size:
+            k = min(10, self._lp_size)
+            stats['recent_win_rate'] = (self._recent_wins * 1000 // k) / 10.0
+
+        self._stats_cache = stats
+        self._stats_dirty = False
         return stats
 
     def reset(self):
-        self.game_history = []
+        self._n = 0
+        self._history_html = _HIST_HTML_HEAD
+        self._dirty = True
+        self._run_len = 0
+        self._run_val = -1
+        self._next_pp_total = min(self.pressure_points)
+        for counts in self._win_counts.values():
+            counts[:] = (0, 0, 0)
+        self._pred_cache.clear()
+        self._pred_cache_order.clear()
         self.prediction_stats = {'wins': 0, 'total': 0, 'win_rate': 0.0}
-        self.last_predictions = deque(maxlen=20)
+        self._lp_pred.fill(-1)
+        self._lp_actual.fill(-1)
+        self._lp_conf.fill(0)
+        self._lp_pos = 0
+        self._lp_size = 0
+        self._recent_wins = 0
+        self._recent_cached = None
+        self._stats_cache = None
+        self._stats_dirty = True
+        self.last_prediction = None
         if 'last_prediction' in st.session_state:
             del st.session_state.last_prediction
 
@@ -331,43 +514,44 @@ if 'predictor' not in st.session_state:
 st.title("🎲 BAC BO PREDICTOR PRO")
 st.markdown("Sistema automático com botões intuitivos e histórico visual")
 
+# Callbacks dos botões: rodam antes do rerun natural do script, sem
+# precisar de st.rerun() (que dispararia uma segunda execução completa)
+def _on_result(result: str):
+    st.session_state.predictor.add_result(result)
+
+
+def _on_reset():
+    st.session_state.predictor.reset()
+
+
 # Coluna principal
 col1, col2 = st.columns([3, 2])
 
 with col1:
     # Seção de botões grandes
     st.subheader("Registrar Resultado")
-    
+
     # Botão PLAYER
-    if st.button("🔵 PLAYER", key="player_btn", help="Clique para registrar vitória do Player"):
-        st.session_state.predictor.add_result("PLAYER")
-        st.rerun()
-    
+    st.button("🔵 PLAYER", key="player_btn", help="Clique para registrar vitória do Player",
+              on_click=_on_result, args=("PLAYER",))
+
     # Botão BANKER
-    if st.button("🔴 BANKER", key="banker_btn", help="Clique para registrar vitória do Banker"):
-        st.session_state.predictor.add_result("BANKER")
-        st.rerun()
-    
+    st.button("🔴 BANKER", key="banker_btn", help="Clique para registrar vitória do Banker",
+              on_click=_on_result, args=("BANKER",))
+
     # Botão TIE
-    if st.button("🟣 TIE", key="tie_btn", help="Clique para registrar um Tie"):
-        st.session_state.predictor.add_result("TIE")
-        st.rerun()
+    st.button("🟣 TIE", key="tie_btn", help="Clique para registrar um Tie",
+              on_click=_on_result, args=("TIE",))
 
     # Botão de reset
-    if st.button("🔄 Reiniciar Sistema", key="reset_btn", help="Limpa todo o histórico"):
-        st.session_state.predictor.reset()
-        st.rerun()
+    st.button("🔄 Reiniciar Sistema", key="reset_btn", help="Limpa todo o histórico",
+              on_click=_on_reset)
 
-    # Histórico visual
+    # Histórico visual (HTML mantido incrementalmente pelo predictor)
     st.subheader("Histórico de Jogadas")
-    if st.session_state.predictor.game_history:
-        history_html = "<div class='history-container'>"
-        for result in st.session_state.predictor.game_history:
-            cls = "player-history" if result == "PLAYER" else "banker-history" if result == "BANKER" else "tie-history"
-            history_html += f"<div class='history-item {cls}'>{result[0]}</div>"
-        history_html += "</div>"
-        st.markdown(history_html, unsafe_allow_html=True)
-        st.caption(f"Total de jogos: {len(st.session_state.predictor.game_history)}")
+    if st.session_state.predictor._n:
+        st.markdown(st.session_state.predictor.history_html(), unsafe_allow_html=True)
+        st.caption(f"Total de jogos: {st.session_state.predictor._n}")
     else:
         st.info("Nenhum resultado registrado ainda")
 
@@ -0,0 +1,106 @@
+"""Núcleo numérico do preditor, compilado com numba quando disponível.
+
+As funções operam apenas sobre arrays int8/int e devolvem tuplas de
+inteiros/floats; códigos de razão são resolvidos para strings apenas no
+wrapper em Bo.py. Sem numba instalado, tudo roda como Python puro.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:  # numba é opcional
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+
+        def wrap(fn):
+            return fn
+        return wrap
+
+# Códigos de razão devolvidos pelos kernels
+R_NONE = 0
+R_QUANTUM_DIFF = 1
+R_QUANTUM_STREAK = 2
+
+
+@njit('UniTuple(int64, 3)(int8[:], int64, int64)', cache=True, nogil=True)
+def count_window(buf, start, stop):
+    """Conta (PLAYER, BANKER, TIE) em buf[start:stop] numa única passada."""
+    p = 0
+    b = 0
+    t = 0
+    for i in range(start, stop):
+        c = buf[i]
+        if c == 0:
+            p += 1
+        elif c == 1:
+            b += 1
+        else:
+            t += 1
+    return p, b, t
+
+
+@njit('Tuple((int64, float64, int64, int64))(int64, int64, int64, int64, int64)',
+      cache=True, nogil=True)
+def quantum_core(p_count, b_count, run_len, run_val, threshold):
+    """Padrão quântico: devolve (código, confiança, razão, argumento)."""
+    diff = p_count - b_count if p_count >= b_count else b_count - p_count
+    if diff >= threshold:
+        code = 1 if p_count > b_count else 0
+        conf = 75 + diff * 2
+        if conf > 90:
+            conf = 90
+        return code, float(conf), R_QUANTUM_DIFF, diff
+
+    if run_len >= 5:
+        code = 1 if run_val == 0 else 0
+        return code, 89.0, R_QUANTUM_STREAK, run_val
+
+    return -1, 0.0, R_NONE, 0
+
+
+@njit('int64(int8[:], int8[:, :])', cache=True, nogil=True)
+def _fib_scan_jit(numeric, trigrams):
+    for k in range(trigrams.shape[0]):
+        a = trigrams[k, 0]
+        b = trigrams[k, 1]
+        c = trigrams[k, 2]
+        for s in range(numeric.shape[0] - 2):
+            if numeric[s] == a and numeric[s + 1] == b and numeric[s + 2] == c:
+                return k
+    return -1
+
+
+def _fib_scan_np(numeric, trigrams):
+    # Fallback sem numba: compara todas as janelas contra todos os
+    # trigramas numa única operação vetorizada (W, K, 3)
+    if numeric.shape[0] < 3:
+        return -1
+    windows = np.lib.stride_tricks.sliding_window_view(numeric, 3)
+    hits = (windows[:, None, :] == trigrams[None, :, :]).all(-1).any(0)
+    matched = np.nonzero(hits)[0]
+    return int(matched[0]) if matched.size else -1
+
+
+# Índice do primeiro trigrama presente em numeric, ou -1
+fib_scan = _fib_scan_jit if NUMBA_AVAILABLE else _fib_scan_np
+
+
+def _warmup():
+    """Exercita os kernels no import para evitar latência na 1ª previsão.
+
+    Com as assinaturas explícitas a compilação já acontece na decoração;
+    as chamadas abaixo só garantem que o cache em disco foi carregado.
+    """
+    dummy = np.zeros(16, dtype=np.int8)
+    count_window(dummy, 0, 10)
+    quantum_core(3, 2, 5, 0, 7)
+    fib_scan(dummy[:10], np.zeros((1, 3), dtype=np.int8))
+
+
+if NUMBA_AVAILABLE:
+    _warmup()